@@ -0,0 +1,78 @@
+"""Micro-benchmark for the TTS audio post-processing stage.
+
+Run from the repository root:
+
+    python -m benchmarks.audio_postprocess --minutes 10 --repeat 5
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from src.agent.audio import float_to_pcm, pcm_to_float, postprocess_pcm
+from src.agent.configuration import Configuration
+
+
+def synthetic_episode(minutes: float, configuration: Configuration, seed: int = 0) -> bytes:
+    """Builds speech-like PCM: tone bursts separated by pauses of random length, padded with silence."""
+    rng = np.random.default_rng(seed)
+    rate = configuration.tts_rate
+    channels = configuration.tts_channels
+    frames = int(minutes * 60 * rate)
+
+    t = np.arange(frames, dtype=np.float32) / rate
+    audio = 0.3 * np.sin(2 * np.pi * 220.0 * t) * (1 + 0.5 * np.sin(2 * np.pi * 3.0 * t))
+
+    # Alternate 1-4s of "speech" with 0.2-2.5s of silence
+    segment_lengths = rng.uniform(0.2, 4.0, size=int(minutes * 60) + 1)
+    boundaries = np.minimum((np.cumsum(segment_lengths) * rate).astype(np.int64), frames)
+    segment_ids = np.searchsorted(boundaries, np.arange(frames), side="right")
+    audio[segment_ids % 2 == 1] = 0.0
+    audio[: rate] = 0.0
+    audio[-rate:] = 0.0
+
+    audio += rng.normal(0.0, 1e-4, size=frames).astype(np.float32)
+    samples = np.repeat(audio[:, None], channels, axis=1)
+    scale = 2 ** (8 * configuration.tts_sample_width - 1) - 1
+    dtype = {1: "u1", 2: "<i2", 4: "<i4"}[configuration.tts_sample_width]
+    if configuration.tts_sample_width == 1:
+        return np.rint(samples * scale + 128).astype(dtype).tobytes()
+    return np.rint(samples * scale).astype(dtype).tobytes()
+
+
+def check_round_trip() -> None:
+    """Full-scale samples must survive float -> PCM -> float without clipping or sign flips."""
+    full_scale = np.array([[1.0], [-1.0]], dtype=np.float32)
+    for sample_width in (1, 2, 4):
+        decoded = pcm_to_float(float_to_pcm(full_scale, sample_width), 1, sample_width)
+        tolerance = 2.0 / 2 ** (8 * sample_width - 1)
+        assert np.allclose(decoded, full_scale, atol=tolerance), f"{sample_width}-byte round trip gave {decoded.ravel()}"
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--minutes", type=float, default=10.0, help="Synthetic episode length")
+    parser.add_argument("--repeat", type=int, default=5, help="Number of timed runs")
+    args = parser.parse_args()
+
+    check_round_trip()
+
+    configuration = Configuration()
+    pcm = synthetic_episode(args.minutes, configuration)
+    postprocess_pcm(pcm, configuration)  # warm-up
+
+    timings = []
+    for _ in range(args.repeat):
+        start = time.perf_counter()
+        processed = postprocess_pcm(pcm, configuration)
+        timings.append(time.perf_counter() - start)
+
+    bytes_per_second = configuration.tts_rate * configuration.tts_channels * configuration.tts_sample_width
+    print(f"Input:  {len(pcm) / bytes_per_second:.1f}s of audio ({len(pcm) / 1e6:.1f} MB)")
+    print(f"Output: {len(processed) / bytes_per_second:.1f}s of audio")
+    print(f"Post-processing: best {min(timings) * 1e3:.1f} ms, mean {np.mean(timings) * 1e3:.1f} ms over {args.repeat} runs")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,309 @@
+"""Vectorized NumPy post-processing for raw TTS PCM audio"""
+
+import wave
+import logging
+from typing import Optional, Union
+
+import numpy as np
+
+from src.agent.configuration import Configuration
+
+logger = logging.getLogger(__name__)
+
+# PCM sample dtypes by sample width in bytes (8-bit WAV is unsigned, the rest signed little-endian)
+_PCM_DTYPES = {1: np.dtype("u1"), 2: np.dtype("<i2"), 4: np.dtype("<i4")}
+
+# Analysis window used for pause detection
+_BLOCK_SECONDS = 0.01
+
+
+def _as_bool(value: Union[bool, str]) -> bool:
+    """Interpret booleans that may arrive as strings from environment variables."""
+    if isinstance(value, str):
+        return value.strip().lower() not in ("", "0", "false", "no", "off")
+    return bool(value)
+
+
+def _db_to_gain(db: float) -> float:
+    return float(10.0 ** (db / 20.0))
+
+
+def pcm_view(pcm: Union[bytes, bytearray, memoryview], sample_width: int = 2) -> np.ndarray:
+    """
+    Returns a zero-copy NumPy view over a raw PCM buffer.
+
+    Args:
+        pcm: Raw interleaved PCM audio data
+        sample_width: Sample width in bytes (1, 2 or 4)
+
+    Returns:
+        Read-only 1-D array of samples sharing memory with ``pcm``
+    """
+    if sample_width not in _PCM_DTYPES:
+        raise ValueError(f"Unsupported PCM sample width: {sample_width} bytes")
+    buffer = memoryview(pcm)
+    usable = len(buffer) - len(buffer) % sample_width
+    return np.frombuffer(buffer[:usable], dtype=_PCM_DTYPES[sample_width])
+
+
+def pcm_to_float(pcm: Union[bytes, bytearray, memoryview], channels: int = 1, sample_width: int = 2) -> np.ndarray:
+    """
+    Decodes raw PCM into a float32 ``(frames, channels)`` array scaled to [-1, 1].
+    """
+    samples = pcm_view(pcm, sample_width)
+    samples = samples[: len(samples) - len(samples) % channels]
+    if sample_width == 1:
+        audio = (samples.astype(np.float32) - 128.0) / 128.0
+    else:
+        audio = samples.astype(np.float32) / float(2 ** (8 * sample_width - 1))
+    return audio.reshape(-1, channels)
+
+
+def float_to_pcm(audio: np.ndarray, sample_width: int = 2) -> bytes:
+    """
+    Encodes a float ``(frames, channels)`` array in [-1, 1] back to raw PCM bytes.
+    """
+    scale = float(2 ** (8 * sample_width - 1))
+    # float64 keeps 2**31 - 1 exact; in float32 it rounds up to 2**31 and overflows int32
+    scaled = np.clip(audio, -1.0, 1.0).astype(np.float64) * (scale - 1)
+    if sample_width == 1:
+        scaled += 128.0
+    return np.rint(scaled).astype(_PCM_DTYPES[sample_width]).tobytes()
+
+
+def _frame_levels(audio: np.ndarray) -> np.ndarray:
+    """Peak absolute amplitude of each frame across channels."""
+    if audio.shape[1] == 1:
+        return np.abs(audio[:, 0])
+    return np.abs(audio).max(axis=1)
+
+
+def _frame_energy(audio: np.ndarray) -> np.ndarray:
+    """Sum of squared samples of each frame across channels."""
+    return np.einsum("ij,ij->i", audio, audio)
+
+
+def trim_silence(audio: np.ndarray, threshold: float, pad_frames: int = 0) -> np.ndarray:
+    """
+    Removes leading and trailing frames whose level stays below ``threshold``.
+
+    Args:
+        audio: Float ``(frames, channels)`` array
+        threshold: Linear amplitude below which a frame counts as silence
+        pad_frames: Frames of silence to keep on each side of the voiced region
+
+    Returns:
+        View of ``audio`` restricted to the voiced region
+    """
+    voiced = _frame_levels(audio) > threshold
+    if not voiced.any():
+        return audio[:0]
+    start = max(int(voiced.argmax()) - pad_frames, 0)
+    end = min(len(audio) - int(voiced[::-1].argmax()) + pad_frames, len(audio))
+    return audio[start:end]
+
+
+def compress_pauses(audio: np.ndarray, threshold: float, max_pause_frames: int, block_frames: int) -> np.ndarray:
+    """
+    Shortens every silent stretch longer than ``max_pause_frames`` down to that length.
+
+    Silence is detected per block of ``block_frames`` frames using block RMS, so
+    brief zero crossings inside speech are never mistaken for pauses.
+
+    Args:
+        audio: Float ``(frames, channels)`` array
+        threshold: Linear RMS below which a block counts as silence
+        max_pause_frames: Longest pause to keep, in frames
+        block_frames: Analysis block size, in frames
+
+    Returns:
+        Array with the excess portion of each long pause removed
+    """
+    block_frames = max(int(block_frames), 1)
+    n_blocks = len(audio) // block_frames
+    max_blocks = max(int(max_pause_frames) // block_frames, 1)
+    if n_blocks <= max_blocks:
+        return audio
+
+    blocks = audio[: n_blocks * block_frames].reshape(n_blocks, -1)
+    silent = np.einsum("ij,ij->i", blocks, blocks) <= threshold ** 2 * blocks.shape[1]
+
+    # Run boundaries of silent blocks: starts where silence begins, ends one past where it stops
+    edges = np.diff(np.concatenate(([0], silent.view(np.int8), [0])))
+    starts = np.flatnonzero(edges == 1)
+    ends = np.flatnonzero(edges == -1)
+    long_runs = (ends - starts) > max_blocks
+    if not long_runs.any():
+        return audio
+
+    # Mark blocks past the allowed pause length in each long run, via a cumulative-sum interval fill
+    marks = np.zeros(n_blocks + 1, dtype=np.int32)
+    np.add.at(marks, starts[long_runs] + max_blocks, 1)
+    np.add.at(marks, ends[long_runs], -1)
+    drop_blocks = np.cumsum(marks[:-1]) > 0
+
+    kept = blocks[~drop_blocks].reshape(-1, audio.shape[1])
+    return np.concatenate((kept, audio[n_blocks * block_frames:]))
+
+
+def normalize_loudness(audio: np.ndarray, target_dbfs: float, peak_ceiling_dbfs: float, threshold: float) -> np.ndarray:
+    """
+    Scales ``audio`` so the RMS of its voiced frames hits ``target_dbfs``,
+    without letting the peak exceed ``peak_ceiling_dbfs``.
+    """
+    if audio.size == 0:
+        return audio
+    levels = _frame_levels(audio)
+    voiced = levels > threshold
+    n_voiced = int(np.count_nonzero(voiced))
+    if n_voiced == 0:
+        return audio
+    energy = _frame_energy(audio)
+    rms = float(np.sqrt(energy[voiced].sum(dtype=np.float64) / (n_voiced * audio.shape[1])))
+    peak = float(levels.max())
+    gain = _db_to_gain(target_dbfs) / rms
+    gain = min(gain, _db_to_gain(peak_ceiling_dbfs) / peak)
+    return audio * np.float32(gain)
+
+
+def limit_peak(audio: np.ndarray, peak_ceiling_dbfs: float) -> np.ndarray:
+    """
+    Scales ``audio`` down, if needed, so its peak does not exceed ``peak_ceiling_dbfs``.
+    """
+    if audio.size == 0:
+        return audio
+    peak = float(_frame_levels(audio).max())
+    ceiling = _db_to_gain(peak_ceiling_dbfs)
+    if peak <= ceiling:
+        return audio
+    return audio * np.float32(ceiling / peak)
+
+
+def load_jingle(path: str, channels: int, rate: int, sample_width: int) -> np.ndarray:
+    """
+    Loads a WAV jingle as a float ``(frames, channels)`` array.
+
+    The jingle must match the TTS stream's format; no resampling is performed.
+    """
+    with wave.open(path, "rb") as wf:
+        params = (wf.getnchannels(), wf.getframerate(), wf.getsampwidth())
+        if params != (channels, rate, sample_width):
+            raise ValueError(
+                f"Jingle {path} has format (channels, rate, sample_width)={params}, "
+                f"expected {(channels, rate, sample_width)}"
+            )
+        frames = wf.readframes(wf.getnframes())
+    return pcm_to_float(frames, channels, sample_width)
+
+
+def mix_jingles(
+    audio: np.ndarray,
+    intro: Optional[np.ndarray] = None,
+    outro: Optional[np.ndarray] = None,
+    gain: float = 1.0,
+    overlap_frames: int = 0,
+) -> np.ndarray:
+    """
+    Places ``intro`` before and ``outro`` after ``audio``, overlapping each by
+    ``overlap_frames`` with a linear fade under the speech.
+
+    Args:
+        audio: Float ``(frames, channels)`` speech array
+        intro: Optional float intro jingle with the same channel count
+        outro: Optional float outro jingle with the same channel count
+        gain: Linear gain applied to the jingles
+        overlap_frames: Frames where jingle and speech play together
+
+    Returns:
+        New array containing the mixed episode
+    """
+    if intro is None and outro is None:
+        return audio
+
+    intro = audio[:0] if intro is None else intro
+    outro = audio[:0] if outro is None else outro
+    intro_overlap = min(overlap_frames, len(intro), len(audio))
+    outro_overlap = min(overlap_frames, len(outro), len(audio))
+
+    speech_start = len(intro) - intro_overlap
+    outro_start = speech_start + len(audio) - outro_overlap
+    mixed = np.zeros((outro_start + len(outro), audio.shape[1]), dtype=np.float32)
+
+    if len(intro):
+        fade_out = np.ones(len(intro), dtype=np.float32)
+        fade_out[len(intro) - intro_overlap:] = np.linspace(1.0, 0.0, intro_overlap, dtype=np.float32)
+        mixed[: len(intro)] += intro * (fade_out[:, None] * gain)
+    mixed[speech_start: speech_start + len(audio)] += audio
+    if len(outro):
+        fade_in = np.ones(len(outro), dtype=np.float32)
+        fade_in[:outro_overlap] = np.linspace(0.0, 1.0, outro_overlap, dtype=np.float32)
+        mixed[outro_start:] += outro * (fade_in[:, None] * gain)
+    return mixed
+
+
+def postprocess_pcm(pcm: Union[bytes, bytearray, memoryview], configuration: Optional[Configuration] = None) -> bytes:
+    """
+    Runs the TTS post-processing stage over raw PCM audio.
+
+    Trims leading/trailing silence, compresses long pauses, normalizes loudness
+    and mixes optional intro/outro jingles. Every step operates on whole NumPy
+    arrays, so the stage costs milliseconds even for long episodes.
+
+    Args:
+        pcm: Raw PCM audio data as returned by the TTS model
+        configuration: Optional Configuration instance
+
+    Returns:
+        Processed raw PCM audio in the same format as the input
+    """
+    if configuration is None:
+        configuration = Configuration()
+    if not _as_bool(configuration.audio_postprocess):
+        return bytes(pcm)
+
+    channels = int(configuration.tts_channels)
+    rate = int(configuration.tts_rate)
+    sample_width = int(configuration.tts_sample_width)
+    threshold = _db_to_gain(float(configuration.silence_threshold_dbfs))
+
+    if sample_width not in _PCM_DTYPES:
+        logger.warning(f"Skipping audio post-processing: unsupported sample width of {sample_width} bytes")
+        return bytes(pcm)
+
+    audio = pcm_to_float(pcm, channels, sample_width)
+    block_frames = max(int(rate * _BLOCK_SECONDS), 1)
+
+    audio = trim_silence(audio, threshold, pad_frames=block_frames)
+    if audio.size == 0:
+        logger.warning("Skipping audio post-processing: TTS output is entirely below the silence threshold")
+        return bytes(pcm)
+    audio = compress_pauses(
+        audio,
+        threshold,
+        max_pause_frames=int(rate * float(configuration.max_pause_seconds)),
+        block_frames=block_frames,
+    )
+    audio = normalize_loudness(
+        audio,
+        float(configuration.loudness_target_dbfs),
+        float(configuration.peak_ceiling_dbfs),
+        threshold,
+    )
+
+    intro = outro = None
+    if configuration.intro_jingle:
+        intro = load_jingle(configuration.intro_jingle, channels, rate, sample_width)
+    if configuration.outro_jingle:
+        outro = load_jingle(configuration.outro_jingle, channels, rate, sample_width)
+    audio = mix_jingles(
+        audio,
+        intro,
+        outro,
+        gain=_db_to_gain(float(configuration.jingle_gain_db)),
+        overlap_frames=int(rate * float(configuration.jingle_overlap_seconds)),
+    )
+    # Jingles overlapping speech can push the sum past the ceiling set during normalization
+    audio = limit_peak(audio, float(configuration.peak_ceiling_dbfs))
+
+    logger.info(f"Post-processed audio: {len(audio) / rate:.1f}s at {rate} Hz")
+    return float_to_pcm(audio, sample_width)
@@ -27,6 +27,20 @@ class Configuration:
     tts_rate: int = 24000
     tts_sample_width: int = 2
 
+    # 🎚️ Audio post-processing
+    audio_postprocess: bool = True
+    loudness_target_dbfs: float = -16.0
+    peak_ceiling_dbfs: float = -1.0
+    silence_threshold_dbfs: float = -45.0
+    max_pause_seconds: float = 0.6
+    intro_jingle: Optional[str] = None
+    outro_jingle: Optional[str] = None
+    jingle_gain_db: float = -6.0
+    jingle_overlap_seconds: float = 1.0
+
+    # 🚦 Concurrency
+    variant_concurrency: int = 3  # Max podcast variants rendered at once, to stay within Gemini quota
+
     @classmethod
     def from_runnable_config(
         cls, config: Optional[RunnableConfig] = None
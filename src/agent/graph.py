@@ -1,6 +1,9 @@
 """LangGraph implementation of the MindCast podcast + research workflow"""
 
+from dataclasses import replace
+
 from langgraph.graph import StateGraph, START, END
+from langgraph.types import Send
 from langchain_core.runnables import RunnableConfig
 from google.genai import types
 from langsmith import traceable
@@ -17,7 +20,7 @@ from src.agent.configuration import Configuration
 
 @traceable(run_type="llm", name="Web Research", project_name="MindCast")
 def search_research_node(state: ResearchState, config: RunnableConfig) -> dict:
-    topic = state["topic"]
+    topic = state.topic
     configuration = Configuration.from_runnable_config(config)
 
     search_response = genai_client.models.generate_content(
@@ -39,8 +42,8 @@ def search_research_node(state: ResearchState, config: RunnableConfig) -> dict:
 
 @traceable(run_type="llm", name="YouTube Video Analysis", project_name="MindCast")
 def analyze_video_node(state: ResearchState, config: RunnableConfig) -> dict:
-    topic = state["topic"]
-    video_url = state.get("video_url")
+    topic = state.topic
+    video_url = state.video_url
     configuration = Configuration.from_runnable_config(config)
 
     if not video_url:
@@ -65,11 +68,11 @@ def create_report_node(state: ResearchState, config: RunnableConfig) -> dict:
     configuration = Configuration.from_runnable_config(config)
 
     report, synthesis_text, report_filename, pdf_filename = create_research_report(
-        topic=state["topic"],
-        search_text=state.get("search_text", ""),
-        video_text=state.get("video_text", ""),
-        search_sources_text=state.get("search_sources_text", ""),
-        video_url=state.get("video_url", ""),
+        topic=state.topic,
+        search_text=state.search_text or "",
+        video_text=state.video_text or "",
+        search_sources_text=state.search_sources_text or "",
+        video_url=state.video_url or "",
         configuration=configuration,
     )
 
@@ -86,9 +89,45 @@ def create_report_node(state: ResearchState, config: RunnableConfig) -> dict:
 def create_podcast_node(state: ResearchState, config: RunnableConfig) -> dict:
     configuration = Configuration.from_runnable_config(config)
 
-    safe_topic = "".join(c for c in state["topic"] if c.isalnum() or c in (' ', '-', '_')).rstrip()
+    safe_topic = "".join(c for c in state.topic if c.isalnum() or c in (' ', '-', '_')).rstrip()
     filename = f"research_podcast_{safe_topic.replace(' ', '_')}.wav"
 
+    podcast_script, podcast_filename = create_podcast_discussion(
+        topic=state.topic,
+        search_text=state.search_text or "",
+        video_text=state.video_text or "",
+        search_sources_text=state.search_sources_text or "",
+        video_url=state.video_url or "",
+        filename=filename,
+        configuration=configuration,
+    )
+
+    return {
+        "podcast_script": podcast_script,
+        "podcast_filename": podcast_filename,
+    }
+
+
+@traceable(run_type="llm", name="Create Podcast Variant", project_name="MindCast")
+def create_podcast_variant_node(state: dict, config: RunnableConfig) -> dict:
+    """Render one requested variant from the shared research; runs concurrently with its siblings.
+
+    Receives the plain-dict Send payload built by fan_out_podcasts, not a ResearchState.
+    """
+    variant = state["variant"]
+    overrides = {
+        field: getattr(variant, field)
+        for field in ("mike_voice", "sarah_voice", "podcast_script_temperature")
+        if getattr(variant, field) is not None
+    }
+    configuration = replace(Configuration.from_runnable_config(config), **overrides)
+
+    safe_topic = "".join(c for c in state["topic"] if c.isalnum() or c in (' ', '-', '_')).rstrip()
+    safe_name = "".join(c for c in (variant.name or "") if c.isalnum() or c in (' ', '-', '_')).strip()
+    # Prefix with the fan-out index so duplicate or empty names never share a file
+    variant_slug = f"{state['variant_index']}_{safe_name.replace(' ', '_')}" if safe_name else f"variant_{state['variant_index']}"
+    filename = f"research_podcast_{safe_topic.replace(' ', '_')}_{variant_slug}.wav"
+
     podcast_script, podcast_filename = create_podcast_discussion(
         topic=state["topic"],
         search_text=state.get("search_text", ""),
@@ -97,17 +136,44 @@ def create_podcast_node(state: ResearchState, config: RunnableConfig) -> dict:
         video_url=state.get("video_url", ""),
         filename=filename,
         configuration=configuration,
+        target_minutes=variant.target_minutes,
     )
 
     return {
-        "podcast_script": podcast_script,
-        "podcast_filename": podcast_filename,
+        "podcast_variants": [{
+            "name": variant.name or f"variant_{state['variant_index']}",
+            "podcast_script": podcast_script,
+            "podcast_filename": podcast_filename,
+            "target_minutes": variant.target_minutes,
+            "mike_voice": configuration.mike_voice,
+            "sarah_voice": configuration.sarah_voice,
+            "podcast_script_temperature": configuration.podcast_script_temperature,
+        }]
     }
 
 
 def should_analyze_video(state: ResearchState) -> str:
     """Decide whether to analyze video or go directly to report"""
-    return "analyze_video" if state.get("video_url") else "create_report"
+    return "analyze_video" if state.video_url else "create_report"
+
+
+def fan_out_podcasts(state: ResearchState):
+    """Send one podcast job per requested variant, or fall back to the single default podcast"""
+    if not state.variants:
+        return "create_podcast"
+
+    shared = {
+        key: getattr(state, key) or ""
+        for key in ("topic", "search_text", "video_text", "search_sources_text", "video_url")
+    }
+    return [
+        Send("create_podcast_variant", {
+            **shared,
+            "variant": variant,
+            "variant_index": i,
+        })
+        for i, variant in enumerate(state.variants, 1)
+    ]
 
 
 def create_research_graph() -> StateGraph:
@@ -122,6 +188,7 @@ def create_research_graph() -> StateGraph:
     graph.add_node("analyze_video", analyze_video_node)
     graph.add_node("create_report", create_report_node)
     graph.add_node("create_podcast", create_podcast_node)
+    graph.add_node("create_podcast_variant", create_podcast_variant_node)
 
     graph.add_edge(START, "search_research")
     graph.add_conditional_edges("search_research", should_analyze_video, {
@@ -129,8 +196,9 @@ def create_research_graph() -> StateGraph:
         "create_report": "create_report"
     })
     graph.add_edge("analyze_video", "create_report")
-    graph.add_edge("create_report", "create_podcast")
+    graph.add_conditional_edges("create_report", fan_out_podcasts, ["create_podcast", "create_podcast_variant"])
     graph.add_edge("create_podcast", END)
+    graph.add_edge("create_podcast_variant", END)
 
     return graph
 
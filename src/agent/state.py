@@ -1,10 +1,23 @@
-from pydantic import BaseModel
-from typing import Optional
+import operator
+from pydantic import BaseModel, Field
+from typing import Annotated, Optional
+
+# Upper bound on podcast variants per request; each one costs a script and a TTS call
+MAX_VARIANTS = 8
+
+class PodcastVariant(BaseModel):
+    """One requested podcast rendition; unset fields fall back to the Configuration"""
+    name: Optional[str] = None
+    target_minutes: Optional[float] = Field(default=None, gt=0)
+    mike_voice: Optional[str] = None
+    sarah_voice: Optional[str] = None
+    podcast_script_temperature: Optional[float] = Field(default=None, ge=0.0, le=2.0)  # Gemini's accepted range
 
 class ResearchStateInput(BaseModel):
     """User-provided input for MindCast research + podcast workflow"""
     topic: str
     video_url: Optional[str] = None  # Optional video or YouTube link
+    variants: list[PodcastVariant] = Field(default_factory=list, max_length=MAX_VARIANTS)  # Optional podcast renditions sharing one research pass
 
 class ResearchStateOutput(BaseModel):
     """Final output from the workflow"""
@@ -13,17 +26,19 @@ class ResearchStateOutput(BaseModel):
     podcast_filename: Optional[str] = None 
     report_filename: Optional[str] = None
     pdf_filename: Optional[str] = None
+    podcast_variants: Annotated[list[dict], operator.add] = []
 
 class ResearchState(BaseModel):
     """Complete state used in the LangGraph workflow"""
     # Input
     topic: str
     video_url: Optional[str] = None
+    variants: list[PodcastVariant] = []
 
     # Intermediate values
     search_text: Optional[str] = None
     search_sources_text: Optional[str] = None
-    video_text: Optional[str]
+    video_text: Optional[str] = None
 
     # Final outputs
     report: Optional[str] = None
@@ -31,3 +46,4 @@ class ResearchState(BaseModel):
     podcast_filename: Optional[str] = None
     report_filename: Optional[str] = None
     pdf_filename: Optional[str] = None
+    podcast_variants: Annotated[list[dict], operator.add] = []  # Filled concurrently, one entry per variant
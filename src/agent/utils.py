@@ -7,6 +7,7 @@ from rich.markdown import Markdown
 from google.genai import Client, types
 from typing import Optional, Tuple
 from src.agent.configuration import Configuration
+from src.agent.audio import postprocess_pcm
 
 load_dotenv()
 
@@ -85,7 +86,8 @@ def create_podcast_discussion(
     search_sources_text: str,
     video_url: Optional[str],
     filename: Optional[str] = None,
-    configuration: Optional[Configuration] = None
+    configuration: Optional[Configuration] = None,
+    target_minutes: Optional[float] = None
 ) -> Tuple[str, str]:
     """
     Creates a podcast conversation and generates audio using Gemini TTS.
@@ -98,6 +100,7 @@ def create_podcast_discussion(
         video_url: Optional URL to the analyzed video.
         filename: Custom output filename. If not provided, one is generated.
         configuration: Optional Configuration instance.
+        target_minutes: Approximate episode length to aim for. Defaults to ~3–4 minutes.
 
     Returns:
         Tuple containing:
@@ -107,6 +110,13 @@ def create_podcast_discussion(
     if configuration is None:
         configuration = Configuration()
 
+    if target_minutes is not None:
+        length_hint = f"~{target_minutes:g} mins"
+        exchanges_hint = f"about {max(2, round(target_minutes * 2))} exchanges"
+    else:
+        length_hint = "~3–4 mins"
+        exchanges_hint = "5–7 exchanges"
+
     # 1. Generate podcast script
     script_prompt = f"""
     Create a natural, engaging podcast conversation between Dr. Sarah (research expert) and Mike (curious interviewer) about "{topic}".
@@ -122,10 +132,10 @@ def create_podcast_discussion(
     Format as a dialogue with:
     - Mike introducing the topic and asking questions
     - Dr. Sarah explaining key concepts and insights
-    - Natural back-and-forth discussion (5–7 exchanges)
+    - Natural back-and-forth discussion ({exchanges_hint})
     - Mike asking follow-up questions
     - Dr. Sarah summarizing key takeaways
-    - Keep it conversational and accessible (~3–4 mins)
+    - Keep it conversational and accessible ({length_hint})
 
     Format like:
     Mike: ...
@@ -175,7 +185,10 @@ def create_podcast_discussion(
 
     audio_data = audio_response.candidates[0].content.parts[0].inline_data.data
 
-    # 3. Save the audio to 'podcasts' folder
+    # 3. Clean up the raw PCM (trim, pause compression, loudness, jingles)
+    audio_data = postprocess_pcm(audio_data, configuration)
+
+    # 4. Save the audio to 'podcasts' folder
     safe_topic = "".join(c for c in topic if c.isalnum() or c in (" ", "-", "_")).rstrip().replace(" ", "_")
     os.makedirs("podcasts", exist_ok=True)
 
@@ -6,6 +6,7 @@ import os
 import logging
 from fastapi.middleware.cors import CORSMiddleware
 from src.agent.graph import create_compiled_graph
+from src.agent.configuration import Configuration
 from src.agent.state import ResearchStateInput
 from fastapi.staticfiles import StaticFiles
 import traceback
@@ -62,12 +63,14 @@ def health_check():
 @app.post("/run")
 async def run_mindcast(payload: ResearchStateInput, request: Request):
     try:
-        result = graph.invoke(payload)
+        configuration = Configuration.from_runnable_config()
+        result = graph.invoke(payload, config={"max_concurrency": int(configuration.variant_concurrency)})
         
         return {
             "report": result.get("report"),
             "podcast_script": result.get("podcast_script"),
             "podcast_filename": result.get("podcast_filename"),
+            "podcast_variants": result.get("podcast_variants", []),
         }
 
     except Exception as e:
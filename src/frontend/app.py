@@ -79,5 +79,28 @@ if run_clicked:
                         else:
                             st.error("⚠️ Failed to load podcast audio. Try again.")
 
+                    # --- Podcast Variants (script + audio per requested variant) ---
+                    for variant in result.get("podcast_variants") or []:
+                        st.markdown(f"### 🎧 Podcast Variant: {variant['name']}")
+
+                        if variant.get("podcast_script"):
+                            with st.expander("🎙️ Podcast Script"):
+                                st.text(variant["podcast_script"])
+
+                        if variant.get("podcast_filename"):
+                            audio_response = requests.get(f"{BACKEND_URL}/static/{variant['podcast_filename']}")
+                            if audio_response.status_code == 200:
+                                st.audio(audio_response.content, format="audio/wav")
+
+                                st.download_button(
+                                    label=f"⬇️ Download {variant['name']} (.wav)",
+                                    data=audio_response.content,
+                                    file_name=variant['podcast_filename'],
+                                    mime="audio/wav",
+                                    key=f"download_{variant['podcast_filename']}"
+                                )
+                            else:
+                                st.error(f"⚠️ Failed to load audio for {variant['name']}. Try again.")
+
             except Exception as e:
                 st.error(f"❌ Request error: {e}")